@@ -5,13 +5,30 @@ This runs automatically via GitHub Actions daily.
 """
 
 import os
+import sys
+import base64
+import heapq
 import json
+import logging
+import re
+import shutil
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import jwt
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+import threading
 import time
+import traceback
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Categories to fetch keywords for
 CATEGORIES = [
     "games",
@@ -28,17 +45,62 @@ CATEGORIES = [
 
 API_BASE_URL = "https://api.searchads.apple.com/api/v4"
 
-def generate_jwt_token():
-    """Generate JWT token for Apple Search Ads API authentication"""
-    import base64
-    
-    client_id = os.environ.get('APPLE_SEARCH_ADS_CLIENT_ID')
-    team_id = os.environ.get('APPLE_SEARCH_ADS_TEAM_ID')
-    key_id = os.environ.get('APPLE_SEARCH_ADS_KEY_ID')
-    private_key_env = os.environ.get('APPLE_SEARCH_ADS_PRIVATE_KEY')
+# Output files are read by the app, so they are compact unless PRETTY_JSON=1
+PRETTY_JSON = os.environ.get('PRETTY_JSON') == '1'
+
+# Number of keywords kept in the daily trending file
+TRENDING_LIMIT = 100
+
+# Shared session so all categories reuse pooled keep-alive connections.
+# The pool is at least as large as the worker count in main() so threads don't queue.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        # Return the last response once retries run out so non-200 handling still logs it
+        raise_on_status=False,
+        # The keyword search endpoint only reads, so retrying POST is safe
+        allowed_methods=frozenset(['GET', 'POST'])
+    )
+))
+
+# Real API calls (and rate limiting) only happen when credentials are configured
+USE_REAL_API = bool(os.environ.get('APPLE_SEARCH_ADS_CLIENT_ID'))
+
+logger = logging.getLogger(__name__)
+
+# Thread pool workers buffer their messages here so main() can log each
+# category's output together instead of interleaving lines across threads
+_LOG_BUFFER = threading.local()
+
+# Same-day sample output is cached on disk so local reruns skip regeneration
+SAMPLE_CACHE_DIR = '.cache'
+_SAMPLE_CACHE = {}
+
+# Cached JWT and decoded private key, reused until the token nears expiry
+_JWT_CACHE = {"token": None, "exp": 0}
+_PRIVATE_KEY_PEM = None
+_PRIVATE_KEY_OBJ = None
+_JWT_LOCK = threading.Lock()
+
+def log(message, level=logging.INFO):
+    """Log a message, deferring it to the current worker's buffer if it has one"""
+    messages = getattr(_LOG_BUFFER, 'messages', None)
+    if messages is not None:
+        messages.append((level, message))
+    else:
+        logger.log(level, message)
+
+def load_private_key_pem(private_key_env):
+    """Decode the private key from the environment once per process"""
+    global _PRIVATE_KEY_PEM
     
-    if not all([client_id, team_id, key_id, private_key_env]):
-        raise ValueError("Missing required environment variables")
+    if _PRIVATE_KEY_PEM is not None:
+        return _PRIVATE_KEY_PEM
     
     # Try to decode if it's base64 encoded, otherwise use as-is
     try:
@@ -50,33 +112,67 @@ def generate_jwt_token():
     if not private_key_pem.startswith('-----BEGIN'):
         raise ValueError("Invalid private key format")
     
-    # Current timestamp
-    now = int(time.time())
-    
-    # JWT payload as per Apple Search Ads API documentation
-    payload = {
-        'sub': client_id,
-        'aud': 'https://appleid.apple.com',
-        'iat': now,
-        'exp': now + 86400,  # 24 hours
-        'iss': team_id
-    }
-    
-    # JWT headers
-    headers = {
-        'alg': 'ES256',
-        'kid': key_id,
-        'typ': 'JWT'
-    }
-    
-    # Generate token
-    token = jwt.encode(payload, private_key_pem, algorithm='ES256', headers=headers)
+    _PRIVATE_KEY_PEM = private_key_pem
+    return _PRIVATE_KEY_PEM
+
+def load_private_key(private_key_env):
+    """Parse the private key into a key object once so signing skips PEM parsing"""
+    global _PRIVATE_KEY_OBJ
     
-    # PyJWT 2.x returns string, older versions return bytes
-    if isinstance(token, bytes):
-        token = token.decode('utf-8')
+    if _PRIVATE_KEY_OBJ is None:
+        private_key_pem = load_private_key_pem(private_key_env)
+        _PRIVATE_KEY_OBJ = load_pem_private_key(private_key_pem.encode('utf-8'), password=None)
     
-    return token
+    return _PRIVATE_KEY_OBJ
+
+def generate_jwt_token():
+    """Generate JWT token for Apple Search Ads API authentication"""
+    # Serialize so concurrent workers share a single signing
+    with _JWT_LOCK:
+        # Reuse the cached token unless it expires within 5 minutes
+        if _JWT_CACHE["token"] and time.time() < _JWT_CACHE["exp"] - 300:
+            return _JWT_CACHE["token"]
+        
+        client_id = os.environ.get('APPLE_SEARCH_ADS_CLIENT_ID')
+        team_id = os.environ.get('APPLE_SEARCH_ADS_TEAM_ID')
+        key_id = os.environ.get('APPLE_SEARCH_ADS_KEY_ID')
+        private_key_env = os.environ.get('APPLE_SEARCH_ADS_PRIVATE_KEY')
+        
+        if not all([client_id, team_id, key_id, private_key_env]):
+            raise ValueError("Missing required environment variables")
+        
+        private_key = load_private_key(private_key_env)
+        
+        # Current timestamp
+        now = int(time.time())
+        
+        # JWT payload as per Apple Search Ads API documentation
+        payload = {
+            'sub': client_id,
+            'aud': 'https://appleid.apple.com',
+            'iat': now,
+            'exp': now + 86400,  # 24 hours
+            'iss': team_id
+        }
+        
+        # JWT headers
+        headers = {
+            'alg': 'ES256',
+            'kid': key_id,
+            'typ': 'JWT'
+        }
+        
+        # Generate token
+        token = jwt.encode(payload, private_key, algorithm='ES256', headers=headers)
+        
+        # PyJWT 2.x returns string, older versions return bytes
+        if isinstance(token, bytes):
+            token = token.decode('utf-8')
+        
+        _JWT_CACHE["token"] = token
+        _JWT_CACHE["exp"] = now + 86400
+        
+        return token
 
 def fetch_keyword_recommendations(category, limit=100):
     """Fetch keyword recommendations from Apple Search Ads API"""
@@ -96,7 +192,7 @@ def fetch_keyword_recommendations(category, limit=100):
     # Apple Search Ads API endpoint for keyword recommendations
     url = f"{API_BASE_URL}/campaigns/{campaign_id}/adgroups/{adgroup_id}/targetingkeywords/find"
     
-    print(f"  Fetching real data from Apple Search Ads for {category}...")
+    log(f"  Fetching real data from Apple Search Ads for {category}...")
     
     # Request body for keyword search
     body = {
@@ -122,182 +218,228 @@ def fetch_keyword_recommendations(category, limit=100):
     }
     
     try:
-        response = requests.post(url, headers=headers, json=body, timeout=30)
+        response = _SESSION.post(url, headers=headers, json=body, timeout=30)
         
         if response.status_code == 200:
             data = response.json()
             if data.get('data'):
-                print(f"    ✓ Found {len(data['data'])} keywords from Apple Search Ads")
+                log(f"    ✓ Found {len(data['data'])} keywords from Apple Search Ads")
                 return data
             else:
-                print(f"    ⚠ No keywords found, using sample data")
+                log(f"    ⚠ No keywords found, using sample data", logging.WARNING)
                 return {'data': generate_sample_keywords(category)}
         else:
-            print(f"    ⚠ API returned {response.status_code}, using sample data")
-            print(f"    Response: {response.text[:200]}")
+            log(f"    ⚠ API returned {response.status_code}, using sample data", logging.WARNING)
+            log(f"    Response: {response.text[:200]}")
             return {'data': generate_sample_keywords(category)}
             
     except Exception as e:
-        print(f"    ⚠ Error: {e}, using sample data")
+        log(f"    ⚠ Error: {e}, using sample data", logging.WARNING)
         return {'data': generate_sample_keywords(category)}
 
-def generate_sample_keywords(category):
-    """Generate sample keyword data until real API integration is complete"""
-    import uuid
-    
-    # Expanded keywords by category (50+ per category)
-    category_keywords = {
-        'games': [
-            'puzzle game', 'action game', 'strategy game', 'casual game', 'multiplayer game',
-            'rpg game', 'adventure game', 'racing game', 'sports game', 'simulation game',
-            'card game', 'board game', 'trivia game', 'word game', 'arcade game',
-            'shooter game', 'platformer game', 'fighting game', 'horror game', 'survival game',
-            'idle game', 'clicker game', 'match 3 game', 'tower defense', 'battle royale',
-            'moba game', 'mmorpg', 'sandbox game', 'roguelike game', 'rhythm game',
-            'puzzle solver', 'brain teaser', 'logic game', 'memory game', 'quiz game',
-            'kids game', 'family game', 'offline game', 'online game', 'free game',
-            'premium game', 'indie game', 'retro game', 'pixel game', '3d game',
-            'vr game', 'ar game', 'educational game', 'math game', 'typing game'
-        ],
-        'business': [
-            'project management', 'team collaboration', 'business analytics', 'crm software', 'invoice app',
-            'accounting software', 'expense tracking', 'time tracking', 'payroll app', 'hr management',
-            'employee scheduling', 'task management', 'workflow automation', 'document management', 'file sharing',
-            'video conferencing', 'team chat', 'email client', 'calendar sync', 'meeting scheduler',
-            'sales crm', 'lead management', 'customer support', 'help desk', 'ticketing system',
-            'inventory management', 'pos system', 'e-commerce platform', 'payment processing', 'billing software',
-            'contract management', 'proposal software', 'quote generator', 'business plan', 'financial planning',
-            'budget planner', 'cash flow', 'profit tracker', 'roi calculator', 'business dashboard',
-            'kpi tracking', 'performance metrics', 'data visualization', 'reporting tool', 'analytics platform',
-            'marketing automation', 'email marketing', 'social media management', 'seo tools', 'content management'
-        ],
-        'productivity': [
-            'task manager', 'todo list', 'note taking', 'calendar app', 'time tracker',
-            'habit tracker', 'goal setting', 'planner app', 'organizer', 'reminder app',
-            'focus timer', 'pomodoro timer', 'time management', 'productivity tracker', 'daily planner',
-            'weekly planner', 'monthly planner', 'bullet journal', 'digital notebook', 'note organizer',
-            'markdown editor', 'text editor', 'writing app', 'document scanner', 'pdf editor',
-            'file manager', 'cloud storage', 'backup app', 'password manager', 'secure notes',
-            'clipboard manager', 'launcher app', 'automation app', 'workflow app', 'shortcut app',
-            'mind map', 'brainstorming', 'idea organizer', 'project planner', 'kanban board',
-            'gtd app', 'eisenhower matrix', 'priority matrix', 'time blocking', 'schedule app',
-            'meeting notes', 'voice recorder', 'transcription app', 'ocr app', 'barcode scanner'
-        ],
-        'education': [
-            'learning app', 'study tools', 'language learning', 'math tutor', 'flashcards',
-            'vocabulary builder', 'grammar checker', 'spelling app', 'reading app', 'speed reading',
-            'comprehension test', 'quiz maker', 'test prep', 'exam practice', 'homework help',
-            'tutoring app', 'online courses', 'video lessons', 'interactive learning', 'educational games',
-            'kids learning', 'preschool app', 'kindergarten app', 'elementary education', 'high school app',
-            'college prep', 'sat prep', 'act prep', 'gre prep', 'gmat prep',
-            'language course', 'spanish learning', 'french learning', 'german learning', 'chinese learning',
-            'japanese learning', 'korean learning', 'english learning', 'esl app', 'pronunciation guide',
-            'science app', 'physics app', 'chemistry app', 'biology app', 'astronomy app',
-            'history app', 'geography app', 'world atlas', 'periodic table', 'calculator app'
-        ],
-        'entertainment': [
-            'streaming app', 'video player', 'music app', 'podcast player', 'radio app',
-            'movie app', 'tv shows', 'anime app', 'drama app', 'documentary app',
-            'music streaming', 'music player', 'audio player', 'equalizer', 'lyrics app',
-            'karaoke app', 'music maker', 'beat maker', 'dj app', 'remix app',
-            'podcast app', 'audiobook player', 'radio player', 'fm radio', 'internet radio',
-            'live streaming', 'video streaming', 'screen recorder', 'video editor', 'photo editor',
-            'meme maker', 'gif maker', 'video maker', 'slideshow maker', 'collage maker',
-            'drawing app', 'painting app', 'sketch app', 'coloring app', 'art app',
-            'comic reader', 'manga reader', 'ebook reader', 'news app', 'magazine app',
-            'trivia app', 'joke app', 'prank app', 'magic tricks', 'party games'
-        ],
-        'finance': [
-            'budget tracker', 'expense manager', 'investment app', 'banking app', 'crypto wallet',
-            'money manager', 'personal finance', 'financial planner', 'savings tracker', 'debt tracker',
-            'bill reminder', 'bill payment', 'split bills', 'expense splitter', 'receipt scanner',
-            'tax calculator', 'tax prep', 'tax filing', 'income tracker', 'paycheck calculator',
-            'retirement planner', 'investment tracker', 'portfolio manager', 'stock tracker', 'stock market',
-            'trading app', 'forex trading', 'crypto trading', 'bitcoin wallet', 'ethereum wallet',
-            'nft wallet', 'defi app', 'blockchain app', 'crypto exchange', 'crypto portfolio',
-            'loan calculator', 'mortgage calculator', 'interest calculator', 'compound interest', 'roi calculator',
-            'net worth tracker', 'asset manager', 'wealth tracker', 'financial goals', 'money goals',
-            'credit score', 'credit monitoring', 'identity protection', 'fraud alert', 'secure banking'
-        ],
-        'health-fitness': [
-            'fitness tracker', 'workout app', 'calorie counter', 'meditation app', 'sleep tracker',
-            'exercise app', 'gym workout', 'home workout', 'yoga app', 'pilates app',
-            'running app', 'walking app', 'cycling app', 'swimming app', 'hiking app',
-            'step counter', 'pedometer', 'activity tracker', 'heart rate monitor', 'blood pressure',
-            'weight tracker', 'bmi calculator', 'body fat calculator', 'macro calculator', 'meal planner',
-            'diet app', 'nutrition tracker', 'food diary', 'water tracker', 'fasting app',
-            'intermittent fasting', 'keto diet', 'vegan recipes', 'healthy recipes', 'meal prep',
-            'mindfulness app', 'breathing exercises', 'stress relief', 'anxiety relief', 'mental health',
-            'therapy app', 'mood tracker', 'journal app', 'gratitude journal', 'self care',
-            'period tracker', 'pregnancy tracker', 'baby tracker', 'health records', 'symptom checker'
-        ],
-        'lifestyle': [
-            'recipe app', 'home design', 'fashion app', 'travel planner', 'dating app',
-            'cooking app', 'meal ideas', 'grocery list', 'shopping list', 'pantry organizer',
-            'interior design', 'room planner', 'furniture app', 'home decor', 'diy projects',
-            'style guide', 'outfit planner', 'wardrobe organizer', 'fashion trends', 'shopping app',
-            'trip planner', 'travel guide', 'hotel booking', 'flight booking', 'vacation planner',
-            'itinerary planner', 'packing list', 'travel tips', 'city guide', 'tourist attractions',
-            'dating tips', 'relationship advice', 'matchmaking', 'chat app', 'meet people',
-            'wedding planner', 'event planner', 'party planner', 'gift ideas', 'wish list',
-            'pet care', 'dog training', 'cat care', 'pet tracker', 'vet finder',
-            'gardening app', 'plant identifier', 'plant care', 'lawn care', 'home maintenance'
-        ],
-        'social-networking': [
-            'messaging app', 'social media', 'video chat', 'community app', 'forum app',
-            'chat app', 'group chat', 'private messaging', 'secure chat', 'encrypted messaging',
-            'voice call', 'video call', 'conference call', 'screen sharing', 'live streaming',
-            'social network', 'photo sharing', 'video sharing', 'story app', 'status updates',
-            'friend finder', 'people nearby', 'local community', 'neighborhood app', 'nextdoor alternative',
-            'professional network', 'business networking', 'linkedin alternative', 'career network', 'job search',
-            'dating network', 'singles app', 'meet friends', 'make friends', 'social discovery',
-            'interest groups', 'hobby groups', 'club app', 'meetup app', 'event app',
-            'anonymous chat', 'random chat', 'stranger chat', 'pen pal', 'language exchange'
-        ],
-        'utilities': [
-            'file manager', 'calculator', 'scanner app', 'weather app', 'vpn app',
-            'file explorer', 'file browser', 'zip app', 'unzip app', 'file compressor',
-            'scientific calculator', 'graphing calculator', 'unit converter', 'currency converter', 'tip calculator',
-            'document scanner', 'pdf scanner', 'qr scanner', 'barcode scanner', 'business card scanner',
-            'weather forecast', 'weather radar', 'weather alerts', 'temperature app', 'climate app',
-            'vpn service', 'proxy app', 'ad blocker', 'privacy app', 'security app',
-            'flashlight app', 'compass app', 'level app', 'ruler app', 'magnifier app',
-            'alarm clock', 'timer app', 'stopwatch', 'world clock', 'time zone converter',
-            'battery saver', 'battery monitor', 'storage cleaner', 'cache cleaner', 'phone cleaner',
-            'wifi analyzer', 'network scanner', 'speed test', 'data monitor', 'call blocker'
-        ]
-    }
-    
-    keywords = category_keywords.get(category, ['app', 'mobile app', 'ios app'])
-    
-    sample_data = []
-    for i, keyword in enumerate(keywords):
+# Expanded keywords by category (50+ per category)
+_CATEGORY_KEYWORDS = {
+    'games': [
+        'puzzle game', 'action game', 'strategy game', 'casual game', 'multiplayer game',
+        'rpg game', 'adventure game', 'racing game', 'sports game', 'simulation game',
+        'card game', 'board game', 'trivia game', 'word game', 'arcade game',
+        'shooter game', 'platformer game', 'fighting game', 'horror game', 'survival game',
+        'idle game', 'clicker game', 'match 3 game', 'tower defense', 'battle royale',
+        'moba game', 'mmorpg', 'sandbox game', 'roguelike game', 'rhythm game',
+        'puzzle solver', 'brain teaser', 'logic game', 'memory game', 'quiz game',
+        'kids game', 'family game', 'offline game', 'online game', 'free game',
+        'premium game', 'indie game', 'retro game', 'pixel game', '3d game',
+        'vr game', 'ar game', 'educational game', 'math game', 'typing game'
+    ],
+    'business': [
+        'project management', 'team collaboration', 'business analytics', 'crm software', 'invoice app',
+        'accounting software', 'expense tracking', 'time tracking', 'payroll app', 'hr management',
+        'employee scheduling', 'task management', 'workflow automation', 'document management', 'file sharing',
+        'video conferencing', 'team chat', 'email client', 'calendar sync', 'meeting scheduler',
+        'sales crm', 'lead management', 'customer support', 'help desk', 'ticketing system',
+        'inventory management', 'pos system', 'e-commerce platform', 'payment processing', 'billing software',
+        'contract management', 'proposal software', 'quote generator', 'business plan', 'financial planning',
+        'budget planner', 'cash flow', 'profit tracker', 'roi calculator', 'business dashboard',
+        'kpi tracking', 'performance metrics', 'data visualization', 'reporting tool', 'analytics platform',
+        'marketing automation', 'email marketing', 'social media management', 'seo tools', 'content management'
+    ],
+    'productivity': [
+        'task manager', 'todo list', 'note taking', 'calendar app', 'time tracker',
+        'habit tracker', 'goal setting', 'planner app', 'organizer', 'reminder app',
+        'focus timer', 'pomodoro timer', 'time management', 'productivity tracker', 'daily planner',
+        'weekly planner', 'monthly planner', 'bullet journal', 'digital notebook', 'note organizer',
+        'markdown editor', 'text editor', 'writing app', 'document scanner', 'pdf editor',
+        'file manager', 'cloud storage', 'backup app', 'password manager', 'secure notes',
+        'clipboard manager', 'launcher app', 'automation app', 'workflow app', 'shortcut app',
+        'mind map', 'brainstorming', 'idea organizer', 'project planner', 'kanban board',
+        'gtd app', 'eisenhower matrix', 'priority matrix', 'time blocking', 'schedule app',
+        'meeting notes', 'voice recorder', 'transcription app', 'ocr app', 'barcode scanner'
+    ],
+    'education': [
+        'learning app', 'study tools', 'language learning', 'math tutor', 'flashcards',
+        'vocabulary builder', 'grammar checker', 'spelling app', 'reading app', 'speed reading',
+        'comprehension test', 'quiz maker', 'test prep', 'exam practice', 'homework help',
+        'tutoring app', 'online courses', 'video lessons', 'interactive learning', 'educational games',
+        'kids learning', 'preschool app', 'kindergarten app', 'elementary education', 'high school app',
+        'college prep', 'sat prep', 'act prep', 'gre prep', 'gmat prep',
+        'language course', 'spanish learning', 'french learning', 'german learning', 'chinese learning',
+        'japanese learning', 'korean learning', 'english learning', 'esl app', 'pronunciation guide',
+        'science app', 'physics app', 'chemistry app', 'biology app', 'astronomy app',
+        'history app', 'geography app', 'world atlas', 'periodic table', 'calculator app'
+    ],
+    'entertainment': [
+        'streaming app', 'video player', 'music app', 'podcast player', 'radio app',
+        'movie app', 'tv shows', 'anime app', 'drama app', 'documentary app',
+        'music streaming', 'music player', 'audio player', 'equalizer', 'lyrics app',
+        'karaoke app', 'music maker', 'beat maker', 'dj app', 'remix app',
+        'podcast app', 'audiobook player', 'radio player', 'fm radio', 'internet radio',
+        'live streaming', 'video streaming', 'screen recorder', 'video editor', 'photo editor',
+        'meme maker', 'gif maker', 'video maker', 'slideshow maker', 'collage maker',
+        'drawing app', 'painting app', 'sketch app', 'coloring app', 'art app',
+        'comic reader', 'manga reader', 'ebook reader', 'news app', 'magazine app',
+        'trivia app', 'joke app', 'prank app', 'magic tricks', 'party games'
+    ],
+    'finance': [
+        'budget tracker', 'expense manager', 'investment app', 'banking app', 'crypto wallet',
+        'money manager', 'personal finance', 'financial planner', 'savings tracker', 'debt tracker',
+        'bill reminder', 'bill payment', 'split bills', 'expense splitter', 'receipt scanner',
+        'tax calculator', 'tax prep', 'tax filing', 'income tracker', 'paycheck calculator',
+        'retirement planner', 'investment tracker', 'portfolio manager', 'stock tracker', 'stock market',
+        'trading app', 'forex trading', 'crypto trading', 'bitcoin wallet', 'ethereum wallet',
+        'nft wallet', 'defi app', 'blockchain app', 'crypto exchange', 'crypto portfolio',
+        'loan calculator', 'mortgage calculator', 'interest calculator', 'compound interest', 'roi calculator',
+        'net worth tracker', 'asset manager', 'wealth tracker', 'financial goals', 'money goals',
+        'credit score', 'credit monitoring', 'identity protection', 'fraud alert', 'secure banking'
+    ],
+    'health-fitness': [
+        'fitness tracker', 'workout app', 'calorie counter', 'meditation app', 'sleep tracker',
+        'exercise app', 'gym workout', 'home workout', 'yoga app', 'pilates app',
+        'running app', 'walking app', 'cycling app', 'swimming app', 'hiking app',
+        'step counter', 'pedometer', 'activity tracker', 'heart rate monitor', 'blood pressure',
+        'weight tracker', 'bmi calculator', 'body fat calculator', 'macro calculator', 'meal planner',
+        'diet app', 'nutrition tracker', 'food diary', 'water tracker', 'fasting app',
+        'intermittent fasting', 'keto diet', 'vegan recipes', 'healthy recipes', 'meal prep',
+        'mindfulness app', 'breathing exercises', 'stress relief', 'anxiety relief', 'mental health',
+        'therapy app', 'mood tracker', 'journal app', 'gratitude journal', 'self care',
+        'period tracker', 'pregnancy tracker', 'baby tracker', 'health records', 'symptom checker'
+    ],
+    'lifestyle': [
+        'recipe app', 'home design', 'fashion app', 'travel planner', 'dating app',
+        'cooking app', 'meal ideas', 'grocery list', 'shopping list', 'pantry organizer',
+        'interior design', 'room planner', 'furniture app', 'home decor', 'diy projects',
+        'style guide', 'outfit planner', 'wardrobe organizer', 'fashion trends', 'shopping app',
+        'trip planner', 'travel guide', 'hotel booking', 'flight booking', 'vacation planner',
+        'itinerary planner', 'packing list', 'travel tips', 'city guide', 'tourist attractions',
+        'dating tips', 'relationship advice', 'matchmaking', 'chat app', 'meet people',
+        'wedding planner', 'event planner', 'party planner', 'gift ideas', 'wish list',
+        'pet care', 'dog training', 'cat care', 'pet tracker', 'vet finder',
+        'gardening app', 'plant identifier', 'plant care', 'lawn care', 'home maintenance'
+    ],
+    'social-networking': [
+        'messaging app', 'social media', 'video chat', 'community app', 'forum app',
+        'chat app', 'group chat', 'private messaging', 'secure chat', 'encrypted messaging',
+        'voice call', 'video call', 'conference call', 'screen sharing', 'live streaming',
+        'social network', 'photo sharing', 'video sharing', 'story app', 'status updates',
+        'friend finder', 'people nearby', 'local community', 'neighborhood app', 'nextdoor alternative',
+        'professional network', 'business networking', 'linkedin alternative', 'career network', 'job search',
+        'dating network', 'singles app', 'meet friends', 'make friends', 'social discovery',
+        'interest groups', 'hobby groups', 'club app', 'meetup app', 'event app',
+        'anonymous chat', 'random chat', 'stranger chat', 'pen pal', 'language exchange'
+    ],
+    'utilities': [
+        'file manager', 'calculator', 'scanner app', 'weather app', 'vpn app',
+        'file explorer', 'file browser', 'zip app', 'unzip app', 'file compressor',
+        'scientific calculator', 'graphing calculator', 'unit converter', 'currency converter', 'tip calculator',
+        'document scanner', 'pdf scanner', 'qr scanner', 'barcode scanner', 'business card scanner',
+        'weather forecast', 'weather radar', 'weather alerts', 'temperature app', 'climate app',
+        'vpn service', 'proxy app', 'ad blocker', 'privacy app', 'security app',
+        'flashlight app', 'compass app', 'level app', 'ruler app', 'magnifier app',
+        'alarm clock', 'timer app', 'stopwatch', 'world clock', 'time zone converter',
+        'battery saver', 'battery monitor', 'storage cleaner', 'cache cleaner', 'phone cleaner',
+        'wifi analyzer', 'network scanner', 'speed test', 'data monitor', 'call blocker'
+    ]
+}
+
+_DEFAULT_KEYWORDS = ['app', 'mobile app', 'ios app']
+
+# Bid strengths indexed by how many popularity thresholds a keyword clears
+_BID_STRENGTHS = ('LOW', 'MEDIUM', 'HIGH', 'VERY_HIGH')
+
+def compute_sample_metrics(count):
+    """Compute popularity, bid strength and bid range for the first count ranks"""
+    metrics = []
+    for i in range(count):
         # Vary popularity more realistically
         base_popularity = 95
         popularity = max(10, base_popularity - (i * 1.5))
         
-        # Vary competition based on popularity
-        if popularity > 80:
-            bid_strength = 'VERY_HIGH'
-        elif popularity > 60:
-            bid_strength = 'HIGH'
-        elif popularity > 40:
-            bid_strength = 'MEDIUM'
-        else:
-            bid_strength = 'LOW'
+        # Vary competition based on popularity (thresholds 40/60/80)
+        bid_strength = _BID_STRENGTHS[(popularity > 40) + (popularity > 60) + (popularity > 80)]
         
-        sample_data.append({
-            'id': str(uuid.uuid4()),
-            'keyword': keyword,
-            'searchPopularity': popularity,
-            'bidStrength': bid_strength,
-            'suggestedBidAmount': {
-                'min': round(0.3 + (popularity / 100), 2),
-                'max': round(1.5 + (popularity / 50), 2),
-                'currency': 'USD'
-            },
-            'category': category.replace('-', ' ').title()
-        })
+        metrics.append((
+            popularity,
+            bid_strength,
+            round(0.3 + (popularity / 100), 2),
+            round(1.5 + (popularity / 50), 2)
+        ))
+    
+    return metrics
+
+# Sample metrics depend only on a keyword's rank, so compute them once
+_SAMPLE_METRICS = compute_sample_metrics(
+    max(len(keywords) for keywords in [_DEFAULT_KEYWORDS, *_CATEGORY_KEYWORDS.values()])
+)
+
+def _fast_ids(count):
+    """Generate count random UUID4 strings from a single os.urandom call"""
+    raw = os.urandom(16 * count).hex()
+    ids = []
+    for i in range(0, 32 * count, 32):
+        h = raw[i:i + 32]
+        # Set the version (4) and RFC 4122 variant bits like uuid.uuid4()
+        variant = '89ab'[int(h[16], 16) & 3]
+        ids.append(f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:32]}")
+    return ids
+
+def generate_sample_keywords(category, output_schema='raw', now_iso=None):
+    """Generate sample keyword data until real API integration is complete"""
+    keywords = _CATEGORY_KEYWORDS.get(category, _DEFAULT_KEYWORDS)
+    ids = _fast_ids(len(keywords))
+    
+    # The 'final' schema matches process_keywords() output, so it can be saved as-is
+    if output_schema == 'final' and now_iso is None:
+        now_iso = datetime.utcnow().isoformat() + 'Z'
+    
+    category_pretty = category.replace('-', ' ').title()
+    sample_data = []
+    for keyword_id, keyword, (popularity, bid_strength, bid_min, bid_max) in zip(ids, keywords, _SAMPLE_METRICS):
+        if output_schema == 'final':
+            sample_data.append({
+                'id': keyword_id,
+                'keyword': keyword,
+                'searchPopularity': popularity,
+                'competitionLevel': map_competition_level(bid_strength),
+                'suggestedBidRange': {
+                    'min': bid_min,
+                    'max': bid_max,
+                    'currency': 'USD'
+                },
+                'category': category_pretty,
+                'lastUpdated': now_iso
+            })
+        else:
+            sample_data.append({
+                'id': keyword_id,
+                'keyword': keyword,
+                'searchPopularity': popularity,
+                'bidStrength': bid_strength,
+                'suggestedBidAmount': {
+                    'min': bid_min,
+                    'max': bid_max,
+                    'currency': 'USD'
+                },
+                'category': category_pretty
+            })
     
     return sample_data
 
@@ -305,3 +447,217 @@ def process_keywords(raw_data):
     """Process raw API data into our format"""
     if not raw_data or 'data' not in raw_data:
         return []
+    
+    now_iso = datetime.utcnow().isoformat() + 'Z'
+    comp_map = _COMPETITION_LEVELS
+    return [
+        {
+            'id': item['id'] if 'id' in item else str(uuid.uuid4()),
+            'keyword': item.get('keyword', item.get('text', '')),
+            'searchPopularity': item.get('searchPopularity', 50),
+            'competitionLevel': comp_map.get(item.get('bidStrength', 'MEDIUM'), 'medium'),
+            'suggestedBidRange': {
+                'min': item.get('suggestedBidAmount', {}).get('min', 0.5),
+                'max': item.get('suggestedBidAmount', {}).get('max', 2.0),
+                'currency': 'USD'
+            },
+            'category': item.get('category', 'General'),
+            'lastUpdated': now_iso
+        }
+        for item in raw_data['data']
+    ]
+
+# Apple's bid strength to our competition level
+_COMPETITION_LEVELS = {
+    'LOW': 'low',
+    'MEDIUM': 'medium',
+    'HIGH': 'high',
+    'VERY_HIGH': 'very_high'
+}
+
+def map_competition_level(bid_strength):
+    """Map Apple's bid strength to our competition level"""
+    return _COMPETITION_LEVELS.get(bid_strength, 'medium')
+
+def _json_default(obj):
+    """Serialize naive UTC datetimes the same way orjson does"""
+    if isinstance(obj, datetime):
+        return obj.isoformat() + 'Z'
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def write_json(filename, data):
+    """Write data to filename as JSON, using orjson when available"""
+    # Serialize fully up front so the file is written in a single call
+    if orjson is not None:
+        option = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+        if PRETTY_JSON:
+            option |= orjson.OPT_INDENT_2
+        buf = orjson.dumps(data, option=option)
+    elif PRETTY_JSON:
+        buf = json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+    else:
+        buf = json.dumps(data, separators=(',', ':'), default=_json_default).encode('utf-8')
+    
+    with open(filename, 'wb') as f:
+        f.write(buf)
+
+def read_json(filename):
+    """Read JSON from filename, using orjson when available"""
+    with open(filename, 'rb') as f:
+        buf = f.read()
+    
+    return orjson.loads(buf) if orjson is not None else json.loads(buf)
+
+def save_keywords(category, keywords):
+    """Save keywords to category JSON file"""
+    filename = f'categories/{category}.json'
+    data = {
+        'keywords': keywords,
+        'generatedAt': datetime.utcnow(),
+        'source': 'Apple Search Ads API'
+    }
+    
+    write_json(filename, data)
+    
+    log(f"  ✓ Saved {len(keywords)} keywords to {filename}")
+
+def track_trending(top, keywords, category_index):
+    """Add keywords to the bounded min-heap of the most popular keywords seen so far"""
+    for rank, keyword in enumerate(keywords):
+        # Popularity ties go to earlier CATEGORIES, then to higher-ranked keywords
+        entry = (keyword['searchPopularity'], -category_index, -rank, keyword)
+        if len(top) < TRENDING_LIMIT:
+            heapq.heappush(top, entry)
+        else:
+            heapq.heappushpop(top, entry)
+
+def save_trending_keywords(top):
+    """Save top trending keywords across all categories"""
+    today = datetime.utcnow().strftime('%Y-%m-%d')
+    filename = f'trending/{today}.json'
+    
+    # Most popular first
+    trending = [keyword for *_, keyword in sorted(top, reverse=True)]
+    
+    data = {
+        'keywords': trending,
+        'generatedAt': datetime.utcnow(),
+        'source': 'Apple Search Ads API'
+    }
+    
+    write_json(filename, data)
+    
+    log(f"\n✓ Saved {len(trending)} trending keywords to {filename}")
+
+def save_metadata():
+    """Save metadata about the data update"""
+    metadata = {
+        'categories': CATEGORIES,
+        'lastUpdated': datetime.utcnow(),
+        'version': '1.0'
+    }
+    
+    write_json('metadata.json', metadata)
+    
+    log("✓ Saved metadata.json")
+
+def cache_sample_output(category, filename, cache_path, today):
+    """Copy a category file into the sample cache and drop its entries from other days"""
+    # Copy to a temp file first so an interrupted run never leaves a partial cache entry
+    tmp_path = f'{cache_path}.tmp'
+    shutil.copy(filename, tmp_path)
+    os.replace(tmp_path, cache_path)
+    
+    pattern = re.compile(rf'{re.escape(category)}-(\d{{4}}-\d{{2}}-\d{{2}})(-pretty)?\.json')
+    for name in os.listdir(SAMPLE_CACHE_DIR):
+        match = pattern.fullmatch(name)
+        if match and match.group(1) != today:
+            os.remove(os.path.join(SAMPLE_CACHE_DIR, name))
+
+def save_sample_keywords(category, now_iso):
+    """Save sample keywords for a category, reusing output cached earlier the same day"""
+    today = now_iso[:10]
+    filename = f'categories/{category}.json'
+    # The cache holds serialized bytes, so compact and pretty output are cached separately
+    cache_path = f'{SAMPLE_CACHE_DIR}/{category}-{today}{"-pretty" if PRETTY_JSON else ""}.json'
+    
+    if os.path.exists(cache_path):
+        shutil.copy(cache_path, filename)
+        keywords = _SAMPLE_CACHE.get((category, today))
+        if keywords is None:
+            keywords = read_json(cache_path)['keywords']
+            _SAMPLE_CACHE[(category, today)] = keywords
+        log(f"  ✓ Restored {len(keywords)} cached keywords to {filename}")
+        return keywords
+    
+    # Sample data is generated directly in the final format
+    keywords = generate_sample_keywords(category, output_schema='final', now_iso=now_iso)
+    save_keywords(category, keywords)
+    cache_sample_output(category, filename, cache_path, today)
+    _SAMPLE_CACHE[(category, today)] = keywords
+    return keywords
+
+def _process_one(category, now_iso, messages):
+    """Fetch, process and save keywords for a single category"""
+    _LOG_BUFFER.messages = messages
+    try:
+        log(f"\nFetching keywords for {category}...")
+        if not USE_REAL_API:
+            log(f"  No API credentials configured, using sample data")
+            return save_sample_keywords(category, now_iso)
+        
+        raw_data = fetch_keyword_recommendations(category)
+        keywords = process_keywords(raw_data)
+        save_keywords(category, keywords)
+        return keywords
+    finally:
+        _LOG_BUFFER.messages = None
+
+def main():
+    """Main function to fetch and save all keyword data"""
+    log("Starting keyword data fetch...")
+    log(f"Timestamp: {datetime.utcnow().isoformat()}")
+    
+    # Create output directories once up front rather than on every save
+    for directory in ('categories', 'trending', SAMPLE_CACHE_DIR):
+        os.makedirs(directory, exist_ok=True)
+    
+    now_iso = datetime.utcnow().isoformat() + 'Z'
+    
+    # Only the top TRENDING_LIMIT keywords are kept while categories finish
+    trending = []
+    
+    # Categories write to separate files, so they can be processed concurrently
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = {}
+        for category in CATEGORIES:
+            messages = []
+            futures[executor.submit(_process_one, category, now_iso, messages)] = (category, messages)
+            # Rate limiting: space out requests to the real API
+            if USE_REAL_API:
+                time.sleep(2)
+        
+        # Collect in CATEGORIES order so output and trending ties don't depend on thread timing
+        for category_index, (future, (category, messages)) in enumerate(futures.items()):
+            # Wait for the worker before replaying its buffered messages
+            error = future.exception()
+            for level, message in messages:
+                logger.log(level, message)
+            if error is not None:
+                log(f"  ✗ Error processing {category}: {error}", logging.ERROR)
+                continue
+            track_trending(trending, future.result(), category_index)
+    
+    save_trending_keywords(trending)
+    save_metadata()
+    
+    log("\n✓ Keyword data fetch complete!")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    try:
+        main()
+    except Exception as e:
+        log(f"\n✗ Fatal error: {e}", logging.ERROR)
+        traceback.print_exc()
+        sys.exit(1)